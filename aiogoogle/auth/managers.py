@@ -25,7 +25,7 @@ from .data import OAUTH2_V2_DISCVOCERY_DOC, WELLKNOWN_OPENID_CONFIGS
 from ..excs import AuthError
 from ..models import Request
 from ..resource import GoogleAPI
-from ..sessions.aiohttp_session import AiohttpSession
+from ..utils import _get_default_session_factory, _run_shared_task
 
 
 # ID token contents: https://openid.net/specs/openid-connect-core-1_0.html#IDToken
@@ -40,6 +40,9 @@ OAUTH2_DISCOVERY_DOCUMENT_URL = (
     "https://www.googleapis.com/discovery/v1/apis/oauth2/v2/rest"
 )
 
+# Parsed once and shared by all OAuth2 and OpenID Connect managers
+_OAUTH2_API = GoogleAPI(OAUTH2_V2_DISCVOCERY_DOC)
+
 # Response types
 AUTH_CODE_RESPONSE_TYPE = "code"  # token for implicit flow and and openid for OpenID
 HYBRID_RESPONSE_TYPE = "code id_token"
@@ -137,15 +140,15 @@ class Oauth2Manager:
 
     Arguments:
 
-        session_factory (aiogoogle.sessions.AbstractSession): A session implementation
+        session_factory (aiogoogle.sessions.AbstractSession): A session implementation. Defaults to ``aiogoogle.sessions.aiohttp_session.AiohttpSession``
 
         verify (bool): whether or not to verify tokens fetched
 
     """
-    def __init__(self, session_factory=AiohttpSession, client_creds=None):
-        self.oauth2_api = GoogleAPI(OAUTH2_V2_DISCVOCERY_DOC)
+    def __init__(self, session_factory=None, client_creds=None):
+        self.oauth2_api = _OAUTH2_API
         self.openid_configs = WELLKNOWN_OPENID_CONFIGS
-        self.session_factory = session_factory
+        self.session_factory = session_factory or _get_default_session_factory()
         self.active_session = None
         self.client_creds = client_creds
 
@@ -174,12 +177,13 @@ class Oauth2Manager:
         await self.active_session.__aexit__(*args, **kwargs)
         self.active_session = None
 
-    async def _send_request(self, req):
-        if self.active_session is None:
+    async def _send_request(self, req, session=None):
+        session = session or self.active_session
+        if session is None:
             async with self.session_factory() as sess:
                 res = await sess.send(req)
         else:
-            res = await self.active_session.send(req)
+            res = await session.send(req)
         return res
 
     async def _refresh_openid_configs(self):
@@ -602,7 +606,7 @@ class Oauth2Manager:
         """
         return _is_expired(creds["expires_at"])
 
-    async def refresh(self, user_creds, client_creds=None):
+    async def refresh(self, user_creds, client_creds=None, session=None):
         """
         Refreshes user_creds
         
@@ -612,6 +616,8 @@ class Oauth2Manager:
 
             client_creds (aiogoogle.auth.creds.ClientCreds): Client Credentials
 
+            session (aiogoogle.sessions.abc.AbstractSession): An already open session to send the refresh request with. Defaults to ``self.active_session`` or a new session
+
         Returns:
 
             aiogoogle.creds.UserCreds: Refreshed user credentials
@@ -622,7 +628,7 @@ class Oauth2Manager:
         """
         client_creds = client_creds or self.client_creds
         request = self._build_refresh_request(user_creds, client_creds)
-        json_res = await self._send_request(request)
+        json_res = await self._send_request(request, session=session)
         return self._build_user_creds_from_res(json_res)
 
     def _build_refresh_request(self, user_creds, client_creds):
@@ -1108,7 +1114,7 @@ class ServiceAccountManager:
     '''
     Arguments:
 
-        session_factory (aiogoogle.sessions.AbstractSession): A session implementation
+        session_factory (aiogoogle.sessions.AbstractSession): A session implementation. Defaults to ``aiogoogle.sessions.aiohttp_session.AiohttpSession``
 
         creds (aiogoogle.auth.creds.ServiceAccountCreds): Service account creds
     '''
@@ -1122,14 +1128,16 @@ class ServiceAccountManager:
 
     def __init__(
         self,
-        session_factory=AiohttpSession,
+        session_factory=None,
         creds=None
     ):
-        self.session_factory = session_factory
+        self.session_factory = session_factory or _get_default_session_factory()
         self.creds = creds or {}
         self._access_token = None
         self._expires_at = None
         self.__creds_source = 'key_file'
+        # In-flight token refreshes keyed by creds source
+        self._refreshes = {}
 
     @property
     def _creds_source(self):
@@ -1178,7 +1186,13 @@ class ServiceAccountManager:
                 self.creds.update(info)
                 self._creds_source = 'key_file'
 
-    async def _set_creds_from_gce(self):
+    async def _send_request(self, req, session=None):
+        if session is None:
+            async with self.session_factory() as sess:
+                return await sess.send(req)
+        return await session.send(req)
+
+    async def _set_creds_from_gce(self, session=None):
         req = Request(
             method="GET",
             url=GCE_METADATA_SERVER_URI + GCE_DEFAULT_SERVICE_ACCOUNT_URL,
@@ -1192,10 +1206,9 @@ class ServiceAccountManager:
                 scopes = ",".join(scopes)
             req._add_query_param({'scopes': scopes})
 
-        async with self.session_factory() as sess:
-            json_res = await sess.send(req)
-            self._access_token = json_res['access_token']
-            self._expires_at = _get_expires_at(json_res['expires_in'])
+        json_res = await self._send_request(req, session=session)
+        self._access_token = json_res['access_token']
+        self._expires_at = _get_expires_at(json_res['expires_in'])
 
     async def detect_default_creds_source(self):
         '''
@@ -1253,7 +1266,7 @@ class ServiceAccountManager:
                     self._creds_source = 'gce'
                     await self.refresh()
 
-    async def _get_oauth2_authorization_grant(self):
+    async def _get_oauth2_authorization_grant(self, session=None):
         if not self.creds:
             raise RuntimeError('No service account credentials were detected.')
 
@@ -1281,18 +1294,17 @@ class ServiceAccountManager:
             additional_claims=additional_claims
         )
 
-        async with self.session_factory() as sess:
-            json_res = await sess.send(Request(
-                method='POST',
-                url=self.creds['token_uri'],
-                headers={
-                    "Content-Type": URLENCODED_CONTENT_TYPE,
-                },
-                data=parse.urlencode({
-                    "assertion": google_auth_lib_creds._make_authorization_grant_assertion(),
-                    "grant_type": JWT_GRANT_TYPE
-                }).encode("utf-8")
-            ))
+        json_res = await self._send_request(Request(
+            method='POST',
+            url=self.creds['token_uri'],
+            headers={
+                "Content-Type": URLENCODED_CONTENT_TYPE,
+            },
+            data=parse.urlencode({
+                "assertion": google_auth_lib_creds._make_authorization_grant_assertion(),
+                "grant_type": JWT_GRANT_TYPE
+            }).encode("utf-8")
+        ), session=session)
 
         if not json_res.get('access_token'):
             raise AuthError('No access token returned. Please check that the scopes you provided are valid')
@@ -1300,10 +1312,14 @@ class ServiceAccountManager:
         self._access_token = json_res['access_token']
         self._expires_at = _get_expires_at(json_res['expires_in'])
 
-    async def refresh(self):
+    async def refresh(self, session=None):
         '''
         Ensures that there's an unexpired access token.
 
+        Arguments:
+
+            session (aiogoogle.sessions.abc.AbstractSession): An already open session to send the token request with. Defaults to a new session
+
         Returns:
 
             None
@@ -1311,10 +1327,13 @@ class ServiceAccountManager:
         if self._access_token and not _is_expired(self._expires_at):
             return
 
+        await _run_shared_task(self._refreshes, self._creds_source, lambda: self._refresh(session))
+
+    async def _refresh(self, session=None):
         if self._creds_source == 'key_file':
-            await self._get_oauth2_authorization_grant()
+            await self._get_oauth2_authorization_grant(session=session)
         elif self._creds_source == 'gce':
-            await self._set_creds_from_gce()
+            await self._set_creds_from_gce(session=session)
         else:
             raise RuntimeError(
                 'No service account creds found.'
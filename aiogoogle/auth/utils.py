@@ -20,16 +20,26 @@ def _get_expires_at(expires_in):
     return expires_at.isoformat()
 
 
-def _is_expired(expires_at):
-    # Refresh in case there's no expires_at present
-    if expires_at is None:
-        return True
+def _parse_expires_at(expires_at):
     if not isinstance(expires_at, datetime.datetime):
         # datetime.fromisoformat is 3.7+
         if sys.version_info[1] <= 6:
             expires_at = _parse_isoformat(expires_at)
         else:
             expires_at = datetime.datetime.fromisoformat(expires_at)
+    return expires_at
+
+
+def _expires_in(expires_at):
+    """ Seconds left until expires_at. Negative if already expired """
+    return (_parse_expires_at(expires_at) - datetime.datetime.utcnow()).total_seconds()
+
+
+def _is_expired(expires_at):
+    # Refresh in case there's no expires_at present
+    if expires_at is None:
+        return True
+    expires_at = _parse_expires_at(expires_at)
     if datetime.datetime.utcnow() >= expires_at:
         return True
     else:
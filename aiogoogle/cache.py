@@ -0,0 +1,98 @@
+__all__ = ["FileDiscoveryCache"]
+
+import os
+import json
+import time
+import tempfile
+from collections.abc import MutableMapping
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".aiogoogle")
+DEFAULT_TTL = 60 * 60 * 24  # 24 hours
+
+
+class FileDiscoveryCache(MutableMapping):
+    """
+    Discovery documents cache that stores each document as a JSON file on disk.
+
+    Pass an instance of it to ``aiogoogle.Aiogoogle(cache=...)`` to share discovered APIs across processes and restarts.
+
+    Keys are ``(api_name, api_version)`` tuples and values are discovery documents.
+
+    Arguments:
+
+        directory (str): Directory to store discovery documents in. Defaults to ``~/.aiogoogle``
+
+        ttl (int): Number of seconds a cached discovery document stays valid for. Defaults to 24 hours
+
+    Example:
+
+        ::
+
+            >>> from aiogoogle.cache import FileDiscoveryCache
+            >>> aiogoogle = Aiogoogle(cache=FileDiscoveryCache())
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL):
+        self.directory = directory
+        self.ttl = ttl
+
+    def _file_path(self, key):
+        api_name, api_version = key
+        # Don't let API names or versions point to files outside of self.directory
+        for part in (api_name, api_version):
+            if "/" in part or os.sep in part or ".." in part:
+                raise ValueError(f"Invalid API name or version: {part}")
+        return os.path.join(self.directory, f"{api_name}_{api_version}.json")
+
+    def _is_stale(self, file_path):
+        return time.time() - os.path.getmtime(file_path) > self.ttl
+
+    def __getitem__(self, key):
+        try:
+            file_path = self._file_path(key)
+            if self._is_stale(file_path):
+                raise KeyError(key)
+            with open(file_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            raise KeyError(key)
+
+    def __setitem__(self, key, discovery_document):
+        file_path = self._file_path(key)
+        os.makedirs(self.directory, exist_ok=True)
+        # Write to a temporary file first so that readers never see a half written document
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(discovery_document, f)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def __delitem__(self, key):
+        try:
+            os.remove(self._file_path(key))
+        except FileNotFoundError:
+            raise KeyError(key)
+
+    def __iter__(self):
+        if not os.path.isdir(self.directory):
+            return
+        for file_name in os.listdir(self.directory):
+            if not file_name.endswith(".json"):
+                continue
+            # API names don't have underscores, but some API versions do. e.g. "directory_v1"
+            key = tuple(file_name[: -len(".json")].split("_", 1))
+            if len(key) != 2:
+                continue
+            try:
+                is_stale = self._is_stale(self._file_path(key))
+            except (OSError, ValueError):  # e.g. deleted after listing the directory
+                continue
+            if not is_stale:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
@@ -1,14 +1,31 @@
 __all__ = ["Aiogoogle"]
 
+import logging
+import time
 
 from .resource import GoogleAPI
 from .auth.managers import Oauth2Manager, ApiKeyManager, OpenIdConnectManager, ServiceAccountManager
-from .sessions.aiohttp_session import AiohttpSession
+from .auth.utils import _expires_in
+from .models import Request, Response
 from .data import DISCOVERY_SERVICE_V1_DISCOVERY_DOC
+from .utils import (
+    _get_running_asyncio_loop,
+    _get_default_session_factory,
+    _get_or_create_shared_task,
+    _run_shared_task,
+)
 
 
+logger = logging.getLogger(__name__)
+
 # Discovery doc reference https://developers.google.com/discovery/v1/reference/apis
 
+# The discovery service's own discovery document never changes at runtime, so all instances share one GoogleAPI
+_DISCOVERY_SERVICE = GoogleAPI(DISCOVERY_SERVICE_V1_DISCOVERY_DOC)
+
+# When user creds are this close (in seconds) to expiring, refresh them in the background while still using the current access token
+USER_CREDS_REFRESH_MARGIN = 300
+
 
 class Aiogoogle:
     """
@@ -34,6 +51,9 @@ class Aiogoogle:
         client_creds (aiogoogle.auth.creds.ClientCreds): OAuth2 client credentials
 
         service_account_creds (aiogoogle.auth.creds.ServiceAccountCreds): Service account credentials
+
+        cache (dict): A dict-like object to cache discovery documents in. Keys are ``(api_name, api_version)`` tuples.
+        Defaults to an in-memory ``dict``. Use ``aiogoogle.cache.FileDiscoveryCache`` to cache them on disk
         
     Note: 
     
@@ -41,18 +61,66 @@ class Aiogoogle:
         
             >>> sess = lambda: Session(your_custome_arg, your_custom_kwarg=True)
             >>> aiogoogle = Aiogoogle(session_factory=sess)
+
+        e.g. to raise the connection pool limits of the default session for large fan-outs: ::
+
+            >>> from functools import partial
+            >>> aiogoogle = Aiogoogle(session_factory=partial(AiohttpSession, connector_limit=200, limit_per_host=50))
+
+    Note:
+
+        If you don't use Aiogoogle as an async context manager, a session is created on the first request and reused for subsequent ones.
+        Call ``await aiogoogle.close()`` once you're done to close it. e.g. ::
+
+            >>> aiogoogle = Aiogoogle()
+            >>> youtube = await aiogoogle.discover('youtube', 'v3')
+            >>> await aiogoogle.close()
+
+        Long running apps (e.g. web servers) should create one instance on startup and close it on shutdown, instead of opening a new session per request. e.g. ::
+
+            >>> async def on_startup(app):
+            ...     app['aiogoogle'] = await Aiogoogle(user_creds=user_creds, client_creds=client_creds).start()
+
+            >>> async def on_shutdown(app):
+            ...     await app['aiogoogle'].aclose()
+
+    Note:
+
+        Multiple requests passed to ``as_user``, ``as_service_account``, ``as_api_key`` or ``as_anon`` are sent concurrently.
+        So ``await aiogoogle.as_user(req1, req2)`` takes about as long as the slowest request, not the sum of both.
     """
 
+    __slots__ = (
+        "session_factory",
+        "active_session",
+        "api_key",
+        "user_creds",
+        "client_creds",
+        "service_account_creds",
+        "api_key_manager",
+        "oauth2",
+        "openid_connect",
+        "service_account_manager",
+        "discovery_service",
+        "cache",
+        "_user_creds_refreshes",
+        "_failed_background_refresh",
+        "_user_creds_expiry",
+        "_send",
+        "__weakref__",
+    )
+
     def __init__(
         self,
-        session_factory=AiohttpSession,
+        session_factory=None,
         api_key=None,
         user_creds=None,
         client_creds=None,
         service_account_creds=None,
+        cache=None,
     ):
 
-        self.session_factory = session_factory
+        self.session_factory = session_factory or _get_default_session_factory()
         self.active_session = None
 
         # Keys
@@ -72,9 +140,18 @@ class Aiogoogle:
         self.service_account_manager = ServiceAccountManager(
             self.session_factory, creds=self.service_account_creds
         )
+        # In-flight user creds refreshes keyed by refresh token
+        self._user_creds_refreshes = {}
+        # (refresh_token, expires_at) of the user creds whose last background refresh failed
+        self._failed_background_refresh = None
+        # (expires_at, time.monotonic() deadline) of the last user creds checked, so expires_at is parsed only once
+        self._user_creds_expiry = (None, None)
+        # Bound ``send`` method of the active session
+        self._send = None
 
         # Discovery service
-        self.discovery_service = GoogleAPI(DISCOVERY_SERVICE_V1_DISCOVERY_DOC)
+        self.discovery_service = _DISCOVERY_SERVICE
+        self.cache = {} if cache is None else cache
 
     # -------- Only 2 methods of Discover Service V1 ---------#
 
@@ -150,6 +227,10 @@ class Aiogoogle:
             When you leave the API version as None, Aiogoogle uses the ``list_api`` method to search for the best fit version of the given API name.
             
             This will result in sending two http requests instead of just one.
+
+        Note:
+
+            Discovery documents are cached in ``self.cache``. Discovering the same API name and version again won't send any http requests.
         
         Arguments:
 
@@ -179,11 +260,15 @@ class Aiogoogle:
             else:
                 raise ValueError("Invalid API name")
 
-        request = self.discovery_service.apis.getRest(
-            api=api_name, version=api_version, validate=False
-        )
-
-        discovery_docuemnt = await self.as_anon(request)
+        cache_key = (api_name, api_version)
+        try:
+            discovery_docuemnt = self.cache[cache_key]
+        except KeyError:
+            request = self.discovery_service.apis.getRest(
+                api=api_name, version=api_version, validate=False
+            )
+            discovery_docuemnt = await self.as_anon(request)
+            self.cache[cache_key] = discovery_docuemnt
 
         return GoogleAPI(discovery_docuemnt, validate)
 
@@ -220,29 +305,85 @@ class Aiogoogle:
             raise TypeError("No user credentials were found")
 
         # Refresh credentials
-        if (
-            user_creds.get("expires_at") is None
-            or (user_creds.get("expires_at") and self.oauth2.is_expired(user_creds) is True)
-        ):
-            user_creds = await self.oauth2.refresh(
-                user_creds, client_creds=self.client_creds
-            )
-
-            # Set refreshed user_creds if ones were already existing
-            if self.user_creds is not None:
-                self.user_creds = user_creds
-
-        authorized_requests = [
-            self.oauth2.authorize(request, user_creds) for request in requests
-        ]
+        expires_at = user_creds.get("expires_at")
+        if expires_at is None:
+            user_creds = await self._refresh_user_creds(user_creds)
+        # Empty expires_at values aren't checked
+        elif expires_at:
+            expires_in = self._user_creds_expires_in(expires_at)
+            if expires_in <= 0:
+                user_creds = await self._refresh_user_creds(user_creds)
+            elif expires_in < USER_CREDS_REFRESH_MARGIN:
+                # Still valid, so don't wait for the refresh
+                self._refresh_user_creds_in_background(user_creds)
 
         return await self.send(
-            *authorized_requests,
+            *(self.oauth2.authorize(request, user_creds) for request in requests),
             timeout=timeout,
             full_res=full_res,
-            session_factory=self.session_factory
         )
 
+    async def as_user_batch(self, *requests, batch_size=50, timeout=None, full_res=False, user_creds=None):
+        """
+        Sends requests on behalf of ``self.user_creds`` (OAuth2) using Google's batch endpoint
+
+        Requests are grouped into batches of ``batch_size`` and each batch is sent as one HTTP request. Batches are sent concurrently.
+
+        See: https://developers.google.com/discovery/v1/batch
+
+        Arguments:
+
+            *requests (aiogoogle.models.Request):
+
+                Requests objects typically created by ``aiogoogle.resource.Method.__call__``.
+                All requests should belong to the same API and shouldn't upload or download media
+
+            batch_size (int):
+
+                Maximum number of requests per batch
+
+            timeout (int):
+
+                Total timeout for all the requests being sent
+
+            full_res (bool):
+
+                If True, returns full HTTP response objects instead of returning their content
+
+            user_creds (aiogoogle.auth.creds.UserCreds):
+
+                If you pass user_creds here, they will only be used for this one request.
+
+        Returns:
+
+            aiogoogle.models.Response: In the same order as ``requests``
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size should be at least 1")
+
+        batches = [
+            requests[i:i + batch_size] for i in range(0, len(requests), batch_size)
+        ]
+        batch_responses = await self.as_user(
+            *[Request.batch_requests(*batch) for batch in batches],
+            timeout=timeout,
+            full_res=True,
+            user_creds=user_creds,
+        )
+        if len(batches) == 1:
+            batch_responses = [batch_responses]
+
+        responses = []
+        for batch, batch_response in zip(batches, batch_responses):
+            responses.extend(Response.batch_responses(batch_response, batch))
+
+        for response in responses:
+            response.raise_for_status()
+        if full_res is False:
+            responses = [response.content for response in responses]
+
+        return responses[0] if len(responses) == 1 else responses
+
     async def as_service_account(self, *requests, timeout=None, full_res=False, service_account_creds=None):
         """ 
         Sends requests on behalf of ``self.user_creds`` (OAuth2)
@@ -273,17 +414,13 @@ class Aiogoogle:
         if service_account_creds is None:
             raise TypeError("Please pass service account creds")
 
-        await self.service_account_manager.refresh()
-
-        authorized_requests = [
-            self.service_account_manager.authorize(request) for request in requests
-        ]
+        await self._ensure_session_set()
+        await self.service_account_manager.refresh(session=self.active_session)
 
         return await self.send(
-            *authorized_requests,
+            *(self.service_account_manager.authorize(request) for request in requests),
             timeout=timeout,
             full_res=full_res,
-            session_factory=self.session_factory
         )
 
     async def as_api_key(self, *requests, timeout=None, full_res=False, api_key=None):
@@ -316,16 +453,10 @@ class Aiogoogle:
         if api_key is None:
             raise TypeError("Please pass an API key")
 
-        authorized_requests = [
-            self.api_key_manager.authorize(request, api_key)
-            for request in requests
-        ]
-
         return await self.send(
-            *authorized_requests,
+            *(self.api_key_manager.authorize(request, api_key) for request in requests),
             timeout=timeout,
             full_res=full_res,
-            session_factory=self.session_factory
         )
 
     async def as_anon(self, *requests, timeout=None, full_res=False):
@@ -354,24 +485,114 @@ class Aiogoogle:
             *requests,
             timeout=timeout,
             full_res=full_res,
-            session_factory=self.session_factory
         )
 
+    def _user_creds_expires_in(self, expires_at):
+        cached_expires_at, deadline = self._user_creds_expiry
+        # Keyed by value rather than by creds object, so creds that were refreshed or updated in place are still detected
+        if expires_at != cached_expires_at:
+            deadline = time.monotonic() + _expires_in(expires_at)
+            self._user_creds_expiry = (expires_at, deadline)
+        return deadline - time.monotonic()
+
+    async def _do_refresh_user_creds(self, user_creds):
+        # Reuse the active session's connection pool for the refresh request
+        await self._ensure_session_set()
+        user_creds = await self.oauth2.refresh(
+            user_creds, client_creds=self.client_creds, session=self.active_session
+        )
+
+        # Set refreshed user_creds if ones were already existing
+        if self.user_creds is not None:
+            self.user_creds = user_creds
+        return user_creds
+
+    async def _refresh_user_creds(self, user_creds):
+        return await _run_shared_task(
+            self._user_creds_refreshes,
+            user_creds.get("refresh_token"),
+            lambda: self._do_refresh_user_creds(user_creds),
+        )
+
+    def _refresh_user_creds_in_background(self, user_creds):
+        loop = _get_running_asyncio_loop()
+        if loop is None or user_creds is not self.user_creds or not user_creds.get("refresh_token"):
+            return
+        creds_key = (user_creds.get("refresh_token"), user_creds.get("expires_at"))
+        # Don't retry a failed background refresh (e.g. a revoked refresh token) on every call.
+        # Once the creds expire, the refresh is retried in the foreground, which raises its error to the caller
+        if creds_key == self._failed_background_refresh:
+            return
+        _get_or_create_shared_task(
+            self._user_creds_refreshes,
+            user_creds.get("refresh_token"),
+            lambda: self._do_refresh_user_creds(user_creds),
+            loop,
+            on_create=lambda task: task.add_done_callback(
+                lambda task: self._on_background_refresh_done(task, creds_key)
+            ),
+        )
+
+    def _on_background_refresh_done(self, task, creds_key):
+        if task.cancelled() or task.exception() is None:
+            return
+        self._failed_background_refresh = creds_key
+        # Nobody might be awaiting a background refresh, so its failure would otherwise only show up once the access token expires
+        logger.error("Refreshing user creds in the background failed", exc_info=task.exception())
+
     async def _ensure_session_set(self):
+        # The session is created lazily and kept open until ``self.close`` is called,
+        # so that consecutive calls (e.g. ``list_api`` then ``discover``) reuse the same connection pool
         if self.active_session is None:
+            # Set before awaiting, so that concurrent first calls don't each open their own session
             self.active_session = self.session_factory()
+            await self.active_session.__aenter__()
+        self._send = self.active_session.send
 
     async def send(self, *args, **kwargs):
-        await self._ensure_session_set()
-        return await self.active_session.send(*args, **kwargs)
+        if self._send is None:
+            await self._ensure_session_set()
+        # Sessions use the factory to create new sessions for e.g. pagination
+        kwargs.setdefault("session_factory", self.session_factory)
+        return await self._send(*args, **kwargs)
 
-    async def __aenter__(self):
+    async def start(self):
+        """
+        Opens a session that's kept open until ``self.close`` is called.
+
+        Only needed if you're not using Aiogoogle as an async context manager and want to open the session before the first request.
+
+        Returns:
+
+            aiogoogle.Aiogoogle: self
+        """
         await self._ensure_session_set()
-        await self.active_session.__aenter__()
         return self
 
+    async def close(self):
+        """
+        Closes the active session, if any.
+
+        Only needed if you're not using Aiogoogle as an async context manager
+        """
+        await self._close_session(None, None, None)
+
+    # Same as close. Lets you use ``contextlib.aclosing(Aiogoogle())``
+    aclose = close
+
+    async def _close_session(self, *exc_info):
+        # Don't let pending refreshes send over a closed session or reopen one after closing
+        refreshes = [*self._user_creds_refreshes.values(), *self.service_account_manager._refreshes.values()]
+        for task in refreshes:
+            task.cancel()
+        if self.active_session is not None:
+            await self.active_session.__aexit__(*exc_info)
+            # Closed sessions cannot be reopened, so it's better to just get rid of the object
+            self.active_session = None
+        self._send = None
+
+    async def __aenter__(self):
+        return await self.start()
+
     async def __aexit__(self, *args):
-        await self.active_session.__aexit__(*args)
-        # Had to add this because there's no use of keeping a closed session
-        # Closed sessions cannot be reopened, so it's better to just get rid of the object
-        self.active_session = None
+        await self._close_session(*args)
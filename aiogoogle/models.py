@@ -1,11 +1,41 @@
 from urllib.parse import urlparse, urlunparse, urlencode, parse_qs
+from json import dumps as json_dumps, loads as json_loads
 import pprint
+import re
+import uuid
 
 from .excs import HTTPError, AuthError
 
 
 DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024
 
+# Batch requests reference: https://developers.google.com/discovery/v1/batch
+BATCH_CONTENT_ID_PREFIX = "item"
+BATCH_RESPONSE_CONTENT_ID_PREFIX = "response-" + BATCH_CONTENT_ID_PREFIX
+BATCH_STATUS_LINE_REGEX = re.compile(r"HTTP/\S+ (\d{3})(?: (.*))?$")
+
+
+def _split_http_message(message):
+    """ Splits an HTTP message (with normalized line endings) to its head and body """
+    head, _, body = message.partition("\n\n")
+    return head, body
+
+
+def _parse_headers(lines):
+    headers = {}
+    for line in lines:
+        name, _, value = line.partition(":")
+        headers[name.strip()] = value.strip()
+    return headers
+
+
+def _get_header(headers, name):
+    """ Case insensitive header lookup """
+    name = name.lower()
+    for k, v in headers.items():
+        if k.lower() == name:
+            return v
+
 
 class ResumableUpload:
     """
@@ -183,20 +213,73 @@ class Request:
         u = u._replace(query=urlencode(query, True))
         self.url = urlunparse(u)
 
+    def _to_batch_part(self):
+        url = urlparse(self.url)
+        path = url.path + ("?" + url.query if url.query else "")
+        lines = [f"{self.method} {path} HTTP/1.1"]
+
+        body = None
+        headers = dict(self.headers)
+        if self.json is not None:
+            body = json_dumps(self.json)
+            headers["Content-Type"] = "application/json"
+        elif self.data is not None:
+            if isinstance(self.data, dict):
+                body = urlencode(self.data)
+            elif isinstance(self.data, bytes):
+                body = self.data.decode("utf-8")
+            else:
+                body = str(self.data)
+
+        lines.extend(f"{k}: {v}" for k, v in headers.items())
+        lines.append("")
+        if body is not None:
+            lines.append(body)
+        return "\r\n".join(lines)
+
     @classmethod
     def batch_requests(cls, *requests):
         """
         Given many requests, will create a batch request per https://developers.google.com/discovery/v1/batch
 
+        Use ``aiogoogle.models.Response.batch_responses`` to split the response of the batch request into a response per request.
+
         Arguments:
 
-            *requests (aiogoogle.models.Request): Request objects
+            *requests (aiogoogle.models.Request): Request objects. Should all belong to the same API
 
         Returns:
 
             aiogoogle.models.Request:
+
+        Raises:
+
+            ValueError: If requests don't share the same batch URL or if any of them uploads or downloads media
         """
-        raise NotImplementedError
+        batch_urls = {request.batch_url for request in requests}
+        if len(batch_urls) != 1 or None in batch_urls:
+            raise ValueError("Only requests of the same API can be batched together")
+
+        boundary = "batch_" + uuid.uuid4().hex
+        parts = []
+        for i, request in enumerate(requests):
+            if request.media_upload or request.media_download:
+                raise ValueError("Requests that upload or download media can't be batched")
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <{BATCH_CONTENT_ID_PREFIX}{i}>\r\n"
+                "\r\n"
+                f"{request._to_batch_part()}\r\n"
+            )
+        parts.append(f"--{boundary}--\r\n")
+
+        return cls(
+            method="POST",
+            url=batch_urls.pop(),
+            headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+            data="".join(parts),
+        )
 
     @classmethod
     def from_response(cls, response):
@@ -262,6 +345,85 @@ class Response:
         self.upload_file = upload_file
         self.session_factory = session_factory
 
+    @classmethod
+    def batch_responses(cls, response, requests=None):
+        """
+        Splits the response of a batch request created by ``aiogoogle.models.Request.batch_requests`` into a response per request
+
+        Arguments:
+
+            response (aiogoogle.models.Response): Full response of the batch request
+
+            requests (list): The batched requests. Used to order responses and to set their ``req`` attribute
+
+        Returns:
+
+            list: aiogoogle.models.Response objects in the same order as the batched requests
+        """
+        content_type = _get_header(response.headers, "Content-Type") or ""
+        match = re.search(r'boundary="?([^";]+)"?', content_type)
+        if match is None:
+            raise ValueError(f"Invalid batch response content type: {content_type}")
+        boundary = match.group(1)
+
+        body = response.data
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        body = body.replace("\r\n", "\n")
+
+        responses = []
+        for part in body.split("--" + boundary)[1:]:
+            if part.startswith("--"):  # closing delimiter
+                break
+            part_head, http_response = _split_http_message(part.lstrip("\n"))
+            content_id = _get_header(_parse_headers(part_head.split("\n")), "Content-ID") or ""
+
+            head, part_body = _split_http_message(http_response)
+            status_line, *header_lines = head.split("\n")
+            status_match = BATCH_STATUS_LINE_REGEX.match(status_line.strip())
+            if status_match is None:
+                raise ValueError(f"Invalid status line in batch response part: {status_line!r}")
+            headers = _parse_headers(header_lines)
+
+            part_body = part_body.rstrip("\n")
+            json = None
+            data = None
+            if part_body:
+                if "json" in (_get_header(headers, "Content-Type") or ""):
+                    json = json_loads(part_body)
+                else:
+                    data = part_body
+
+            index = content_id.strip("<>")
+            if index.startswith(BATCH_RESPONSE_CONTENT_ID_PREFIX):
+                index = index[len(BATCH_RESPONSE_CONTENT_ID_PREFIX):]
+                if not index.isdigit():
+                    raise ValueError(f"Invalid Content-ID in batch response part: {content_id}")
+                index = int(index)
+            else:
+                index = len(responses)
+            if requests is not None:
+                if index >= len(requests):
+                    raise ValueError(
+                        f"Batch response part {content_id or index} doesn't match any of the {len(requests)} batched requests"
+                    )
+                req = requests[index]
+            else:
+                req = None
+
+            responses.append((index, cls(
+                status_code=int(status_match.group(1)),
+                headers=headers,
+                url=req.url if req is not None else None,
+                json=json,
+                data=data,
+                reason=status_match.group(2) or "",
+                req=req,
+                session_factory=response.session_factory,
+            )))
+
+        return [res for _, res in sorted(responses, key=lambda item: item[0])]
+
     @staticmethod
     async def _next_page_generator(
         prev_res,
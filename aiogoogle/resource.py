@@ -3,7 +3,7 @@ __all__ = ["GoogleAPI", "Resource", "Method"]
 import re
 import warnings
 from urllib.parse import urlencode, quote_plus
-from functools import wraps
+from functools import wraps, lru_cache
 from typing import List, Generic, TypeVar
 
 from .excs import ValidationError
@@ -32,6 +32,9 @@ STACK_QUERY_PARAMETERS = frozenset(["trace", "pp", "strict"])
 STACK_QUERY_PARAMETER_DEFAULT_VALUE = {"type": "string", "location": "query"}
 MEDIA_SIZE_BIT_SHIFTS = {"KB": 10, "MB": 20, "GB": 30, "TB": 40}
 
+# Named placeholders in method paths. e.g. {param}, {+resourceName}
+PATH_PLACEHOLDER_REGEX = re.compile(r"\{(.*?)\}")
+
 # TODO: etagRequired: {
 #    type: "boolean",  # noqa: F821 (weird error)
 #    description: "Whether this method requires an ETag to be specified. The ETag is sent as an HTTP If-Match or If-None-Match header."
@@ -39,6 +42,19 @@ MEDIA_SIZE_BIT_SHIFTS = {"KB": 10, "MB": 20, "GB": 30, "TB": 40}
 # NOTE: etagRequired is only mentioned once in all of the discovery documents available from Google. (In discovery_service-v1. So, it isn't actually being used)
 
 
+@lru_cache(maxsize=1024)
+def _compile_path_template(path):
+    """
+    Replaces named placeholders with empty ones. e.g. {param} --> {}
+
+    Why? Because some endpoints have different names in their url path placeholders than in their parameter defenitions
+    e.g. path: {"v1/{+resourceName}/connections"}. e.g. param name: resourceName NOT +resourceName
+
+    Cached, so every path is only compiled once no matter how many times its method is called
+    """
+    return PATH_PLACEHOLDER_REGEX.sub("{}", path)
+
+
 def _temporarily_add_back_dashes_to_param_definitions(f):
     """
         When instantiating a Method, Method's constructor will remove all 
@@ -584,14 +600,8 @@ class Method:
                 sorted_required_path_params[k] = quote_plus(str(v))
 
             # Build full path
-            # replace named placeholders with empty ones. e.g. {param} --> {}
-            # Why? Because some endpoints have different names in their url path placeholders than in their parameter defenitions
-            # e.g. path: {"v1/{+resourceName}/connections"}. e.g. param name: resourceName NOT +resourceName
-            self._method_specs["path"] = re.sub(
-                r"\{(.*?)\}", r"{}", self._method_specs["path"]
-            )
-            return base_url + self["path"].format(
-                *list(sorted_required_path_params.values())
+            return base_url + _compile_path_template(self["path"]).format(
+                *sorted_required_path_params.values()
             )
         else:
             return base_url + self["path"]
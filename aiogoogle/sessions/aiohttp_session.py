@@ -3,17 +3,56 @@ __all__ = ["AiohttpSession"]
 import asyncio
 from json import JSONDecodeError
 
-from aiohttp import ClientSession, MultipartWriter
+from aiohttp import ClientSession, MultipartWriter, TCPConnector
 from aiohttp.client_exceptions import ContentTypeError
 import aiofiles
 from aiofiles import os as async_os
 import async_timeout
 
+# orjson is an optional, faster JSON decoder. Mostly noticeable when decoding large discovery documents
+try:
+    from orjson import loads as json_loads
+    HAS_ORJSON = True
+except ImportError:
+    from json import loads as json_loads
+    HAS_ORJSON = False
+
 from ..models import Response
 from .abc import AbstractSession
 from ..excs import ValidationError
 
 
+def _is_json_content_type(content_type):
+    return content_type == "application/json" or content_type.endswith("+json")
+
+
+def _is_utf8(charset):
+    return charset is None or charset.lower() in ("utf-8", "utf8")
+
+
+async def _read_json(response):
+    """
+    Same as ``response.json()``, except that with orjson installed, UTF-8 bodies are decoded from the raw bytes.
+
+    That skips the intermediate str copy of the body, which matters for large discovery documents.
+    Without orjson there's no memory benefit (``json.loads`` decodes bytes to a str internally), so ``response.json()`` is used as is.
+    Bodies declaring another charset also go through ``response.json()``, which honors it.
+    """
+    if not HAS_ORJSON or not _is_utf8(response.charset):
+        return await response.json(loads=json_loads)
+    if not _is_json_content_type(response.content_type):
+        raise ContentTypeError(
+            response.request_info,
+            response.history,
+            message=f"Attempt to decode JSON with unexpected mimetype: {response.content_type}",
+            headers=response.headers,
+        )
+    body = await response.read()
+    if not body.strip():
+        return None
+    return json_loads(body)
+
+
 async def _get_file_size(full_file_path):
     stat = await async_os.stat(full_file_path)
     return stat.st_size
@@ -29,6 +68,49 @@ async def _aiter_file(file_name, chunk_size):
 
 
 class AiohttpSession(ClientSession, AbstractSession):
+    """
+    Aiohttp implementation of ``aiogoogle.sessions.abc.AbstractSession``
+
+    Arguments:
+
+        connector_limit (int): Total number of simultaneous connections. Defaults to 100
+
+        limit_per_host (int): Number of simultaneous connections to the same endpoint. Defaults to 0 (no limit)
+
+        ttl_dns_cache (int): Number of seconds to cache DNS lookups for. Defaults to 300
+
+        max_concurrent_requests (int): Maximum number of requests this session sends at once. Requests above it wait for a free slot. Defaults to None (no limit other than ``connector_limit``)
+
+        *args, **kwargs: Passed to ``aiohttp.ClientSession``. If you pass a ``connector``, the arguments above are ignored
+
+    Example:
+
+        ::
+
+            >>> from functools import partial
+            >>> aiogoogle = Aiogoogle(session_factory=partial(AiohttpSession, connector_limit=200, limit_per_host=50))
+    """
+
+    def __init__(
+        self,
+        *args,
+        connector_limit=100,
+        limit_per_host=0,
+        ttl_dns_cache=300,
+        max_concurrent_requests=None,
+        **kwargs
+    ):
+        if kwargs.get("connector") is None:
+            kwargs["connector"] = TCPConnector(
+                limit=connector_limit,
+                limit_per_host=limit_per_host,
+                ttl_dns_cache=ttl_dns_cache,
+            )
+        super().__init__(*args, **kwargs)
+        self._max_concurrent_requests = max_concurrent_requests
+        # Created on first send, so that it's bound to the running event loop
+        self._semaphore = None
+
     async def send(
         self,
         *requests,
@@ -52,7 +134,7 @@ class AiohttpSession(ClientSession, AbstractSession):
             else:
                 if response.status != 204:  # If no (no content)
                     try:
-                        json = await response.json()
+                        json = await _read_json(response)
                     except (JSONDecodeError, ContentTypeError):
                         try:
                             data = await response.text()
@@ -153,8 +235,13 @@ class AiohttpSession(ClientSession, AbstractSession):
 
         # ----------------- send sequence ------------------#
         async def get_response(request):
-            response = await fire_request(request)
-            response = await resolve_response(request, response)
+            if semaphore is not None:
+                async with semaphore:
+                    response = await fire_request(request)
+                    response = await resolve_response(request, response)
+            else:
+                response = await fire_request(request)
+                response = await resolve_response(request, response)
             if raise_for_status is True:
                 response.raise_for_status()
             return response
@@ -166,18 +253,19 @@ class AiohttpSession(ClientSession, AbstractSession):
         # ----------------- /send sequence ------------------#
 
         async def schedule_tasks():
+            # asyncio.gather wraps the coroutines in tasks itself, so all requests are sent concurrently
             if full_res is True:
-                tasks = [
-                    asyncio.ensure_future(get_response(request)) for request in requests
-                ]
+                coros = [get_response(request) for request in requests]
             else:
-                tasks = [
-                    asyncio.ensure_future(get_content(request)) for request in requests
-                ]
-            return await asyncio.gather(*tasks, return_exceptions=False)
+                coros = [get_content(request) for request in requests]
+            return await asyncio.gather(*coros, return_exceptions=False)
 
         session_factory = self.__class__ if session_factory is None else session_factory
 
+        if self._semaphore is None and self._max_concurrent_requests is not None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        semaphore = self._semaphore
+
         if timeout is not None:
             async with async_timeout.timeout(timeout):
                 results = await schedule_tasks()
@@ -1,7 +1,9 @@
 __all__ = []
 
+import asyncio
 import datetime
 import re
+import sys
 
 
 def _safe_getitem(dct, *keys):
@@ -13,6 +15,64 @@ def _safe_getitem(dct, *keys):
     return dct
 
 
+def _get_default_session_factory():
+    """ Imports the default session lazily, so that aiohttp isn't imported when another session is used """
+    from .sessions.aiohttp_session import AiohttpSession
+
+    return AiohttpSession
+
+
+def _get_running_asyncio_loop():
+    """ Returns the running asyncio event loop or None if not running in one (e.g. running with trio or curio) """
+    # asyncio.get_running_loop is 3.7+
+    if sys.version_info[1] <= 6:
+        return asyncio._get_running_loop()
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _get_or_create_shared_task(tasks, key, coro_fn, loop, on_create=None):
+    """
+    Returns the pending task stored under ``key`` in ``tasks``, or runs ``coro_fn()`` as a new one.
+
+    ``on_create`` is called with the task only if a new one was created. e.g. to add done callbacks once per task rather than once per caller.
+
+    Lets concurrent callers share a single task (e.g. a token refresh) instead of each starting their own.
+    Tasks remove themselves from ``tasks`` once done.
+    """
+    task = tasks.get(key)
+    if task is None:
+        task = loop.create_task(coro_fn())
+        tasks[key] = task
+
+        def on_done(task):
+            tasks.pop(key, None)
+            # Mark the exception as retrieved. Callers awaiting the task will still get it
+            if not task.cancelled():
+                task.exception()
+
+        task.add_done_callback(on_done)
+        if on_create is not None:
+            on_create(task)
+    return task
+
+
+async def _run_shared_task(tasks, key, coro_fn):
+    """
+    Awaits ``coro_fn()``, sharing a single run of it between concurrent callers with the same ``key`` (e.g. a token refresh)
+
+    Only done when running with asyncio. With other async frameworks (e.g. trio or curio) ``coro_fn()`` is awaited directly.
+
+    The shared task is shielded, so that cancelling one caller doesn't cancel it for everyone else.
+    """
+    loop = _get_running_asyncio_loop()
+    if loop is None:
+        return await coro_fn()
+    return await asyncio.shield(_get_or_create_shared_task(tasks, key, coro_fn, loop))
+
+
 class _dict(dict):  # pragma: no cover
     """ A simple dict subclass for use with Creds modelling. No surprises """
 
@@ -41,5 +41,5 @@ setup(
         "Programming Language :: Python :: 3.7",
         "Operating System :: OS Independent",
     ],
-    extras_require={"curio_asks": ["asks", "curio"], "trio_asks": ["asks", "trio"]},
+    extras_require={"curio_asks": ["asks", "curio"], "trio_asks": ["asks", "trio"], "orjson": ["orjson"]},
 )
@@ -0,0 +1,418 @@
+import asyncio
+import datetime
+import re
+import subprocess
+import sys
+import weakref
+
+import pytest
+
+from aiogoogle.client import Aiogoogle
+from aiogoogle.models import Response
+from aiogoogle.sessions.abc import AbstractSession
+from aiogoogle.utils import _get_running_asyncio_loop
+
+
+class FakeSession(AbstractSession):
+    instances = []
+
+    def __init__(self):
+        self.entered = False
+        self.exited = False
+        self.sent = []
+        FakeSession.instances.append(self)
+
+    async def __aenter__(self):
+        self.entered = True
+        return self
+
+    async def __aexit__(self, *args):
+        self.exited = True
+
+    @staticmethod
+    def respond(request):
+        if request.url == "https://oauth2.googleapis.com/token":
+            return {
+                "access_token": "refreshed",
+                "refresh_token": "refresh",
+                "expires_in": 3600,
+                "scope": "a_scope",
+            }
+        if "/batch/" in request.url:
+            return _batch_response(request)
+        return {"items": [{"name": "youtube", "version": "v3"}]}
+
+    async def send(self, *requests, timeout=None, full_res=False, session_factory=None):
+        self.sent.extend(requests)
+        responses = [self.respond(request) for request in requests]
+        return responses[0] if len(responses) == 1 else responses
+
+
+def _batch_response(batch_request):
+    # Responds with the Content-ID of every batched request as its JSON content
+    boundary = "batch_response"
+    content_ids = re.findall(r"Content-ID: <(.*?)>", batch_request.data)
+    data = "".join(
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\n"
+        f"Content-ID: <response-{content_id}>\r\n"
+        "\r\n"
+        "HTTP/1.1 200 OK\r\n"
+        "Content-Type: application/json\r\n"
+        "\r\n"
+        f'{{"id": "{content_id}"}}\r\n'
+        for content_id in content_ids
+    ) + f"--{boundary}--\r\n"
+    return Response(
+        status_code=200,
+        headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+        data=data,
+        req=batch_request,
+    )
+
+
+@pytest.fixture
+def fake_session_factory():
+    FakeSession.instances = []
+    return FakeSession
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused_across_calls(fake_session_factory):
+    aiogoogle = Aiogoogle(session_factory=fake_session_factory)
+    await aiogoogle.list_api("youtube")
+    await aiogoogle.list_api("youtube")
+
+    assert len(FakeSession.instances) == 1
+    session = FakeSession.instances[0]
+    assert session.entered is True
+    assert len(session.sent) == 2
+
+    await aiogoogle.close()
+    assert session.exited is True
+    assert aiogoogle.active_session is None
+
+
+class SuspendingFakeSession(FakeSession):
+    async def __aenter__(self):
+        # Yields to the event loop, like a session doing I/O when it's opened
+        await asyncio.sleep(0)
+        return await super().__aenter__()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_share_one_session(fake_session_factory):
+    aiogoogle = Aiogoogle(session_factory=SuspendingFakeSession)
+    await asyncio.gather(*(aiogoogle.list_api("youtube") for _ in range(3)))
+
+    assert len(FakeSession.instances) == 1
+    session = FakeSession.instances[0]
+    assert len(session.sent) == 3
+
+    await aiogoogle.close()
+    assert session.exited is True
+
+
+@pytest.mark.asyncio
+async def test_close_without_session_is_noop(fake_session_factory):
+    aiogoogle = Aiogoogle(session_factory=fake_session_factory)
+    await aiogoogle.close()
+    assert FakeSession.instances == []
+
+
+@pytest.mark.asyncio
+async def test_context_manager_closes_session(fake_session_factory):
+    async with Aiogoogle(session_factory=fake_session_factory) as aiogoogle:
+        await aiogoogle.list_api("youtube")
+    assert len(FakeSession.instances) == 1
+    assert FakeSession.instances[0].exited is True
+
+
+@pytest.mark.asyncio
+async def test_discover_caches_discovery_documents(fake_session_factory):
+    aiogoogle = Aiogoogle(session_factory=fake_session_factory)
+    await aiogoogle.discover("youtube", "v3")
+    await aiogoogle.discover("youtube", "v3")
+
+    assert len(FakeSession.instances[0].sent) == 1
+    assert ("youtube", "v3") in aiogoogle.cache
+    await aiogoogle.close()
+
+
+@pytest.mark.asyncio
+async def test_discover_uses_provided_cache(fake_session_factory):
+    cache = {("youtube", "v3"): {"name": "youtube", "version": "v3"}}
+    aiogoogle = Aiogoogle(session_factory=fake_session_factory, cache=cache)
+    youtube = await aiogoogle.discover("youtube", "v3")
+
+    assert youtube["name"] == "youtube"
+    assert FakeSession.instances == []
+
+
+@pytest.mark.asyncio
+async def test_as_user_refreshes_with_active_session(fake_session_factory):
+    aiogoogle = Aiogoogle(
+        session_factory=fake_session_factory,
+        user_creds={"access_token": "expired", "refresh_token": "refresh"},
+        client_creds={"client_id": "id", "client_secret": "secret"},
+    )
+    request = aiogoogle.discovery_service.apis.list(name="youtube")
+    await aiogoogle.as_user(request)
+
+    assert len(FakeSession.instances) == 1
+    assert len(FakeSession.instances[0].sent) == 2
+    assert aiogoogle.user_creds["access_token"] == "refreshed"
+    assert request.headers["Authorization"] == "Bearer refreshed"
+    await aiogoogle.close()
+
+
+def _is_token_request(request):
+    return request.url == "https://oauth2.googleapis.com/token"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_as_user_calls_share_one_refresh(fake_session_factory):
+    aiogoogle = Aiogoogle(
+        session_factory=fake_session_factory,
+        user_creds={"access_token": "expired", "refresh_token": "refresh"},
+        client_creds={"client_id": "id", "client_secret": "secret"},
+    )
+    requests = [aiogoogle.discovery_service.apis.list(name="youtube") for _ in range(5)]
+    await asyncio.gather(*(aiogoogle.as_user(request) for request in requests))
+
+    sent = FakeSession.instances[0].sent
+    assert len([req for req in sent if _is_token_request(req)]) == 1
+    assert all(req.headers["Authorization"] == "Bearer refreshed" for req in requests)
+    await aiogoogle.close()
+
+
+@pytest.mark.asyncio
+async def test_as_user_refreshes_soon_to_expire_creds_in_background(fake_session_factory):
+    expires_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=60)
+    aiogoogle = Aiogoogle(
+        session_factory=fake_session_factory,
+        user_creds={
+            "access_token": "current",
+            "refresh_token": "refresh",
+            "expires_at": expires_at.isoformat(),
+        },
+        client_creds={"client_id": "id", "client_secret": "secret"},
+    )
+    request = aiogoogle.discovery_service.apis.list(name="youtube")
+    await aiogoogle.as_user(request)
+
+    # The request didn't wait for the refresh
+    assert request.headers["Authorization"] == "Bearer current"
+
+    await asyncio.gather(*aiogoogle._user_creds_refreshes.values())
+    assert aiogoogle.user_creds["access_token"] == "refreshed"
+    await aiogoogle.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_is_logged(fake_session_factory, monkeypatch, caplog):
+    async def refresh(*args, **kwargs):
+        raise RuntimeError("Token has been expired or revoked.")
+
+    expires_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=60)
+    aiogoogle = Aiogoogle(
+        session_factory=fake_session_factory,
+        user_creds={
+            "access_token": "current",
+            "refresh_token": "refresh",
+            "expires_at": expires_at.isoformat(),
+        },
+        client_creds={"client_id": "id", "client_secret": "secret"},
+    )
+    monkeypatch.setattr(aiogoogle.oauth2, "refresh", refresh)
+    # Callers joining the same refresh don't log its failure again
+    await asyncio.gather(*(aiogoogle.as_user(aiogoogle.discovery_service.apis.list(name="youtube")) for _ in range(3)))
+    await asyncio.gather(*aiogoogle._user_creds_refreshes.values(), return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert caplog.text.count("Refreshing user creds in the background failed") == 1
+    assert "Token has been expired or revoked." in caplog.text
+    await aiogoogle.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_isnt_retried_until_creds_expire(fake_session_factory, monkeypatch):
+    refreshes = []
+
+    async def refresh(*args, **kwargs):
+        refreshes.append(args)
+        raise RuntimeError("Token has been expired or revoked.")
+
+    expires_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=60)
+    aiogoogle = Aiogoogle(
+        session_factory=fake_session_factory,
+        user_creds={
+            "access_token": "current",
+            "refresh_token": "refresh",
+            "expires_at": expires_at.isoformat(),
+        },
+        client_creds={"client_id": "id", "client_secret": "secret"},
+    )
+    monkeypatch.setattr(aiogoogle.oauth2, "refresh", refresh)
+    for _ in range(5):
+        await aiogoogle.as_user(aiogoogle.discovery_service.apis.list(name="youtube"))
+        await asyncio.gather(*aiogoogle._user_creds_refreshes.values(), return_exceptions=True)
+    assert len(refreshes) == 1
+
+    # Expired creds are refreshed in the foreground, which raises the error
+    aiogoogle.user_creds["expires_at"] = "2000-01-01T00:00:00"
+    with pytest.raises(RuntimeError):
+        await aiogoogle.as_user(aiogoogle.discovery_service.apis.list(name="youtube"))
+    assert len(refreshes) == 2
+    await aiogoogle.close()
+
+
+@pytest.mark.asyncio
+async def test_as_user_doesnt_check_empty_expires_at(fake_session_factory):
+    aiogoogle = Aiogoogle(
+        session_factory=fake_session_factory,
+        user_creds={"access_token": "token", "refresh_token": "refresh", "expires_at": ""},
+    )
+    request = aiogoogle.discovery_service.apis.list(name="youtube")
+    await aiogoogle.as_user(request)
+
+    assert FakeSession.instances[0].sent == [request]
+    assert request.headers["Authorization"] == "Bearer token"
+    await aiogoogle.close()
+
+
+@pytest.mark.asyncio
+async def test_as_user_batch(fake_session_factory):
+    aiogoogle = Aiogoogle(
+        session_factory=fake_session_factory,
+        user_creds={"access_token": "token", "expires_at": "3000-01-01T00:00:00"},
+    )
+    requests = [aiogoogle.discovery_service.apis.list(name=str(i)) for i in range(5)]
+    responses = await aiogoogle.as_user_batch(*requests, batch_size=2)
+
+    sent = FakeSession.instances[0].sent
+    assert len(sent) == 3
+    assert all(req.headers["Authorization"] == "Bearer token" for req in sent)
+    assert responses == [{"id": "item0"}, {"id": "item1"}, {"id": "item0"}, {"id": "item1"}, {"id": "item0"}]
+    await aiogoogle.close()
+
+
+def test_instances_share_discovery_service():
+    assert Aiogoogle().discovery_service is Aiogoogle().discovery_service
+
+
+@pytest.mark.asyncio
+async def test_as_api_key_sends_authorized_requests(fake_session_factory):
+    aiogoogle = Aiogoogle(session_factory=fake_session_factory, api_key="a_key")
+    requests = [aiogoogle.discovery_service.apis.list(name="youtube") for _ in range(2)]
+    await aiogoogle.as_api_key(*requests)
+
+    assert FakeSession.instances[0].sent == requests
+    assert all(request.url.endswith("key=a_key") for request in requests)
+    await aiogoogle.close()
+
+
+@pytest.mark.asyncio
+async def test_as_user_parses_expires_at_once(fake_session_factory, monkeypatch):
+    calls = []
+
+    def _expires_in(expires_at):
+        calls.append(expires_at)
+        return 3600
+
+    monkeypatch.setattr("aiogoogle.client._expires_in", _expires_in)
+    aiogoogle = Aiogoogle(
+        session_factory=fake_session_factory,
+        user_creds={"access_token": "token", "expires_at": "3000-01-01T00:00:00"},
+    )
+    for _ in range(3):
+        await aiogoogle.as_user(aiogoogle.discovery_service.apis.list(name="youtube"))
+    assert calls == ["3000-01-01T00:00:00"]
+
+    aiogoogle.user_creds["expires_at"] = "3000-01-02T00:00:00"
+    await aiogoogle.as_user(aiogoogle.discovery_service.apis.list(name="youtube"))
+    assert len(calls) == 2
+    await aiogoogle.close()
+
+
+@pytest.mark.asyncio
+async def test_start_and_aclose(fake_session_factory):
+    aiogoogle = await Aiogoogle(session_factory=fake_session_factory).start()
+    session = aiogoogle.active_session
+    assert session.entered is True
+
+    await aiogoogle.list_api("youtube")
+    assert FakeSession.instances == [session]
+
+    await aiogoogle.aclose()
+    assert session.exited is True
+    assert aiogoogle.active_session is None
+
+
+@pytest.mark.asyncio
+async def test_closing_inside_context_manager(fake_session_factory):
+    async with Aiogoogle(session_factory=fake_session_factory) as aiogoogle:
+        await aiogoogle.close()
+    assert aiogoogle.active_session is None
+
+
+def test_aiogoogle_has_no_instance_dict():
+    assert not hasattr(Aiogoogle(), "__dict__")
+
+
+def test_aiogoogle_is_weak_referenceable():
+    aiogoogle = Aiogoogle()
+    assert weakref.ref(aiogoogle)() is aiogoogle
+
+
+def test_importing_aiogoogle_doesnt_import_aiohttp():
+    subprocess.run(
+        [sys.executable, "-c", "import sys, aiogoogle; assert 'aiohttp' not in sys.modules"],
+        check=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_send_opens_a_new_session_after_close(fake_session_factory):
+    aiogoogle = Aiogoogle(session_factory=fake_session_factory)
+    await aiogoogle.list_api("youtube")
+    await aiogoogle.close()
+    await aiogoogle.list_api("youtube")
+
+    assert len(FakeSession.instances) == 2
+    assert len(FakeSession.instances[1].sent) == 1
+    await aiogoogle.close()
+
+
+@pytest.mark.parametrize("version_info", [(3, 6, 15), sys.version_info])
+def test_get_running_asyncio_loop(version_info, monkeypatch):
+    async def main():
+        return _get_running_asyncio_loop()
+
+    monkeypatch.setattr("aiogoogle.utils.sys.version_info", version_info)
+    assert _get_running_asyncio_loop() is None
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(main()) is loop
+    finally:
+        loop.close()
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_pending_service_account_refreshes(fake_session_factory, monkeypatch):
+    async def _refresh(session=None):
+        await asyncio.Event().wait()
+
+    aiogoogle = Aiogoogle(session_factory=fake_session_factory, service_account_creds={"type": "service_account"})
+    monkeypatch.setattr(aiogoogle.service_account_manager, "_refresh", _refresh)
+    as_service_account = asyncio.ensure_future(
+        aiogoogle.as_service_account(aiogoogle.discovery_service.apis.list(name="youtube"))
+    )
+    await asyncio.sleep(0)
+    refreshes = list(aiogoogle.service_account_manager._refreshes.values())
+    assert len(refreshes) == 1
+
+    await aiogoogle.close()
+    await asyncio.wait([as_service_account], timeout=1)
+    assert refreshes[0].cancelled()
+    assert as_service_account.cancelled()
@@ -1,6 +1,7 @@
 import pytest
 
 from aiogoogle.resource import GoogleAPI, Method, STACK_QUERY_PARAMETERS
+from aiogoogle.data import DISCOVERY_SERVICE_V1_DISCOVERY_DOC
 from ..ALL_APIS import ALL_APIS
 
 
@@ -89,3 +90,14 @@ def test_stack_parameters_are_passed_correctly(open_discovery_document, name, ve
         for stack_param_name in STACK_QUERY_PARAMETERS:
             assert stack_param_name in method.optional_parameters
             assert stack_param_name in method.parameters
+
+
+def test_build_url_with_path_placeholders():
+    discovery_service = GoogleAPI(DISCOVERY_SERVICE_V1_DISCOVERY_DOC)
+    method = discovery_service.apis.getRest
+    path = method["path"]
+
+    req = method(api="youtube", version="v3")
+    assert req.url == "https://www.googleapis.com/discovery/v1/apis/youtube/v3/rest"
+    # The discovery document's path template isn't modified
+    assert method["path"] == path == "apis/{api}/{version}/rest"
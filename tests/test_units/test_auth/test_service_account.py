@@ -1,3 +1,7 @@
+import asyncio
+
+import pytest
+
 from aiogoogle.auth.managers import ServiceAccountManager
 
 
@@ -18,3 +22,24 @@ def test_authorize():
     authorized_req = man.authorize(req)
 
     assert authorized_req.headers['Authorization'] == 'Bearer 123'
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_send_one_token_request():
+    class Session:
+        def __init__(self):
+            self.sent = []
+
+        async def send(self, req, **kwargs):
+            self.sent.append(req)
+            await asyncio.sleep(0)
+            return {"access_token": "token", "expires_in": 3600}
+
+    man = ServiceAccountManager()
+    man._creds_source = 'gce'
+    session = Session()
+
+    await asyncio.gather(*(man.refresh(session=session) for _ in range(5)))
+
+    assert len(session.sent) == 1
+    assert man._access_token == 'token'
@@ -0,0 +1,61 @@
+import os
+import time
+
+import pytest
+
+from aiogoogle.cache import FileDiscoveryCache
+
+
+def test_file_discovery_cache_roundtrip(tmp_path):
+    cache = FileDiscoveryCache(directory=str(tmp_path))
+    cache[("admin", "directory_v1")] = {"name": "admin"}
+
+    assert cache[("admin", "directory_v1")] == {"name": "admin"}
+    assert ("admin", "directory_v1") in cache
+    assert list(cache) == [("admin", "directory_v1")]
+    assert len(cache) == 1
+
+
+def test_file_discovery_cache_missing_key(tmp_path):
+    cache = FileDiscoveryCache(directory=str(tmp_path / "doesnt_exist"))
+    with pytest.raises(KeyError):
+        cache[("youtube", "v3")]
+    assert len(cache) == 0
+
+
+def test_file_discovery_cache_expires(tmp_path):
+    cache = FileDiscoveryCache(directory=str(tmp_path), ttl=60)
+    cache[("youtube", "v3")] = {"name": "youtube"}
+
+    an_hour_ago = time.time() - 60 * 60
+    os.utime(cache._file_path(("youtube", "v3")), (an_hour_ago, an_hour_ago))
+
+    assert ("youtube", "v3") not in cache
+
+
+def test_file_discovery_cache_delete(tmp_path):
+    cache = FileDiscoveryCache(directory=str(tmp_path))
+    cache[("youtube", "v3")] = {"name": "youtube"}
+    del cache[("youtube", "v3")]
+
+    assert ("youtube", "v3") not in cache
+    with pytest.raises(KeyError):
+        del cache[("youtube", "v3")]
+
+
+@pytest.mark.parametrize("key", [("../../x", "v1"), ("youtube", "../v3"), ("..", "v1")])
+def test_file_discovery_cache_rejects_paths_outside_directory(tmp_path, key):
+    cache = FileDiscoveryCache(directory=str(tmp_path / "cache"))
+    with pytest.raises(ValueError):
+        cache[key] = {"name": "x"}
+    with pytest.raises(KeyError):
+        cache[key]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_file_discovery_cache_iter_skips_files_deleted_while_listing(tmp_path, monkeypatch):
+    cache = FileDiscoveryCache(directory=str(tmp_path))
+    cache[("youtube", "v3")] = {"name": "youtube"}
+    monkeypatch.setattr(os, "listdir", lambda directory: ["deleted_v1.json", "youtube_v3.json"])
+
+    assert list(cache) == [("youtube", "v3")]
@@ -4,7 +4,9 @@
 # TODO: Test next page generator
 # TODO: Test response.__call__ returns pagination gen
 # TODO: Test next_page returns a valid request
-from aiogoogle.models import Request
+import pytest
+
+from aiogoogle.models import Request, Response
 
 
 def test_request_add_query_param():
@@ -29,3 +31,116 @@ def test_request_add_query_param3():
     r = Request(url="https://example.com/foo?bar=baz")
     r._add_query_param({'idk': 'fuuu'})
     assert r.url == 'https://example.com/foo?bar=baz&idk=fuuu'
+
+
+def test_batch_requests():
+    requests = [
+        Request(
+            method="GET",
+            url="https://www.googleapis.com/youtube/v3/videos?part=id",
+            batch_url="https://www.googleapis.com/batch/youtube/v3",
+        ),
+        Request(
+            method="POST",
+            url="https://www.googleapis.com/youtube/v3/playlists",
+            batch_url="https://www.googleapis.com/batch/youtube/v3",
+            json={"foo": "bar"},
+        ),
+    ]
+    batch = Request.batch_requests(*requests)
+
+    assert batch.method == "POST"
+    assert batch.url == "https://www.googleapis.com/batch/youtube/v3"
+    boundary = batch.headers["Content-Type"].split("boundary=")[1]
+    assert batch.data == (
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\n"
+        "Content-ID: <item0>\r\n"
+        "\r\n"
+        "GET /youtube/v3/videos?part=id HTTP/1.1\r\n"
+        "\r\n"
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\n"
+        "Content-ID: <item1>\r\n"
+        "\r\n"
+        "POST /youtube/v3/playlists HTTP/1.1\r\n"
+        "Content-Type: application/json\r\n"
+        "\r\n"
+        '{"foo": "bar"}\r\n'
+        f"--{boundary}--\r\n"
+    )
+
+
+def test_batch_requests_of_different_apis():
+    with pytest.raises(ValueError):
+        Request.batch_requests(
+            Request(method="GET", url="https://a.com/a", batch_url="https://a.com/batch"),
+            Request(method="GET", url="https://b.com/b", batch_url="https://b.com/batch"),
+        )
+
+
+def test_batch_responses():
+    requests = [Request(url="https://example.com/0"), Request(url="https://example.com/1")]
+    batch_response = Response(
+        status_code=200,
+        headers={"Content-Type": "multipart/mixed; boundary=batch_foo"},
+        data=(
+            "--batch_foo\r\n"
+            "Content-Type: application/http\r\n"
+            "Content-ID: <response-item1>\r\n"
+            "\r\n"
+            "HTTP/1.1 404 Not Found\r\n"
+            "Content-Type: text/plain\r\n"
+            "\r\n"
+            "not found\r\n"
+            "--batch_foo\r\n"
+            "Content-Type: application/http\r\n"
+            "Content-ID: <response-item0>\r\n"
+            "\r\n"
+            "HTTP/1.1 200 OK\r\n"
+            "Content-Type: application/json; charset=UTF-8\r\n"
+            "\r\n"
+            '{"id": "0"}\r\n'
+            "--batch_foo--\r\n"
+        ),
+    )
+    responses = Response.batch_responses(batch_response, requests)
+
+    assert [res.status_code for res in responses] == [200, 404]
+    assert responses[0].json == {"id": "0"}
+    assert responses[0].req is requests[0]
+    assert responses[1].data == "not found"
+    assert responses[1].reason == "Not Found"
+    assert responses[1].url == "https://example.com/1"
+
+
+def _batch_response_part(content_id, status_line):
+    return Response(
+        status_code=200,
+        headers={"Content-Type": "multipart/mixed; boundary=batch_foo"},
+        data=(
+            "--batch_foo\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <{content_id}>\r\n"
+            "\r\n"
+            f"{status_line}\r\n"
+            "\r\n"
+            "--batch_foo--\r\n"
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "content_id,status_line",
+    [
+        ("response-item1", "HTTP/1.1 200 OK"),
+        ("response-itemfoo", "HTTP/1.1 200 OK"),
+        ("response-item0", "Content-Type: application/json"),
+        ("response-item0", ""),
+    ],
+)
+def test_batch_responses_invalid_part(content_id, status_line):
+    with pytest.raises(ValueError):
+        Response.batch_responses(
+            _batch_response_part(content_id, status_line), [Request(url="https://example.com/0")]
+        )
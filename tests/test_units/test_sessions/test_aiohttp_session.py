@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import TCPConnector, web
+
+from aiogoogle.models import Request
+from aiogoogle.sessions.aiohttp_session import AiohttpSession
+
+
+@pytest_asyncio.fixture
+async def serve():
+    """ Serves aiohttp apps on localhost and returns their base URL. Servers are shut down after the test """
+    runners = []
+
+    async def _serve(app):
+        runner = web.AppRunner(app)
+        runners.append(runner)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    yield _serve
+    for runner in runners:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_default_connector_limits():
+    async with AiohttpSession() as sess:
+        assert sess.connector.limit == 100
+        assert sess.connector.limit_per_host == 0
+
+
+@pytest.mark.asyncio
+async def test_custom_connector_limits():
+    async with AiohttpSession(connector_limit=200, limit_per_host=30) as sess:
+        assert sess.connector.limit == 200
+        assert sess.connector.limit_per_host == 30
+
+
+@pytest.mark.asyncio
+async def test_passed_connector_is_used():
+    connector = TCPConnector(limit=5)
+    async with AiohttpSession(connector=connector) as sess:
+        assert sess.connector is connector
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_requests(serve):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    base_url = await serve(app)
+
+    async with AiohttpSession(max_concurrent_requests=2) as sess:
+        requests = [Request("GET", f"{base_url}/") for _ in range(6)]
+        responses = await sess.send(*requests)
+
+    assert len(responses) == 6
+    assert max_in_flight == 2
+
+
+def _respond(**kwargs):
+    async def handler(request):
+        return web.Response(**kwargs)
+
+    return handler
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("has_orjson", [True, False])
+async def test_response_content_decoding(has_orjson, monkeypatch, serve):
+    monkeypatch.setattr("aiogoogle.sessions.aiohttp_session.HAS_ORJSON", has_orjson)
+    app = web.Application()
+    app.router.add_get("/json", _respond(text='{"foo": "bar"}', content_type="application/json"))
+    app.router.add_get("/problem", _respond(text='{"foo": "bar"}', content_type="application/problem+json"))
+    app.router.add_get("/invalid", _respond(text="{foo", content_type="application/json"))
+    app.router.add_get("/text", _respond(text="foo"))
+    app.router.add_get("/empty", _respond(text="", content_type="application/json"))
+    app.router.add_get("/latin1", _respond(text='{"foo": "bär"}', content_type="application/json", charset="latin-1"))
+    base_url = await serve(app)
+
+    async with AiohttpSession() as sess:
+        responses = await sess.send(
+            *[
+                Request("GET", f"{base_url}/{path}")
+                for path in ["json", "problem", "invalid", "text", "empty", "latin1"]
+            ],
+            full_res=True,
+        )
+
+    assert [(res.json, res.data) for res in responses] == [
+        ({"foo": "bar"}, None),
+        ({"foo": "bar"}, None),
+        (None, "{foo"),
+        (None, "foo"),
+        (None, None),
+        ({"foo": "bär"}, None),
+    ]